@@ -64,6 +64,47 @@ def calculate_confusion_by_classes(
     return confusion_by_classes
 
 
+@dataclass
+class ConfusionMatrixMetrics:
+    accuracy: float
+    precision: float
+    recall: float
+    f1: float
+    precision_by_classes: np.ndarray
+    recall_by_classes: np.ndarray
+    f1_by_classes: np.ndarray
+    present_classes: np.ndarray
+
+
+def calculate_confusion_matrix_metrics(confusion_matrix: np.ndarray) -> ConfusionMatrixMetrics:
+    """Calculate accuracy, precision, recall and f1 for each class and their macro averages from confusion matrix.
+
+    The matrix can hold counts or shares of objects.
+    Undefined precision, recall and f1 are set to 0, and macro averages are taken over classes
+    that present in target or in predictions - the same way as sklearn metrics do.
+    """
+    true_positive = np.diag(confusion_matrix)
+    predicted = confusion_matrix.sum(axis=0)
+    actual = confusion_matrix.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.nan_to_num(true_positive / predicted)
+        recall = np.nan_to_num(true_positive / actual)
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+
+    present = (predicted > 0) | (actual > 0)
+    return ConfusionMatrixMetrics(
+        accuracy=float(true_positive.sum() / confusion_matrix.sum()),
+        precision=float(precision[present].mean()),
+        recall=float(recall[present].mean()),
+        f1=float(f1[present].mean()),
+        precision_by_classes=precision,
+        recall_by_classes=recall,
+        f1_by_classes=f1,
+        present_classes=present,
+    )
+
+
 def k_probability_threshold(prediction_probas: pd.DataFrame, k: Union[int, float]) -> float:
     probas = prediction_probas.iloc[:, 0].sort_values(ascending=False)
     if isinstance(k, float):
@@ -265,10 +306,23 @@ def calculate_matrix(
     labels: List[Union[str, int]],
 ) -> ConfusionMatrix:
     sorted_labels = sorted(labels)
-    matrix = metrics.confusion_matrix(target, prediction, labels=sorted_labels)
+    target_codes = pd.Categorical(target, categories=sorted_labels).codes
+    prediction_codes = pd.Categorical(prediction, categories=sorted_labels).codes
+    matrix = calculate_matrix_encoded(target_codes, prediction_codes, len(sorted_labels))
     return ConfusionMatrix(sorted_labels, [row.tolist() for row in matrix])
 
 
+def calculate_matrix_encoded(target_codes: np.ndarray, prediction_codes: np.ndarray, labels_count: int) -> np.ndarray:
+    """Build a confusion matrix from target and prediction encoded as positions in a sorted labels list.
+
+    Pairs where either code is negative (a value not in the labels) are skipped.
+    """
+    known = (target_codes >= 0) & (prediction_codes >= 0)
+    matrix = np.zeros((labels_count, labels_count), dtype=np.int64)
+    np.add.at(matrix, (target_codes[known], prediction_codes[known]), 1)
+    return matrix
+
+
 def collect_plot_data(prediction_probas: pd.DataFrame):
     res = {}
     mins = []
@@ -306,6 +360,18 @@ class DatasetClassificationQuality:
     plot_data: Optional[Dict] = None
 
 
+def _binarize_target(target: pd.Series, labels: Sequence) -> np.ndarray:
+    """One-hot encode target values in the order of labels. Values are matched with labels by their string form.
+
+    Only unique target values are converted to strings, target itself is compared by integer codes.
+    """
+    target_codes, target_uniques = pd.factorize(target)
+    codes_by_str = {str(value): code for code, value in enumerate(target_uniques)}
+    # -2 never matches a target code: factorize codes are not negative except -1 for missing values
+    labels_codes = np.array([codes_by_str.get(str(label), -2) for label in labels])
+    return (target_codes.reshape(-1, 1) == labels_codes).astype(int)
+
+
 def calculate_metrics(
     column_mapping: ColumnMapping,
     confusion_matrix: ConfusionMatrix,
@@ -324,27 +390,37 @@ def calculate_metrics(
     log_loss = None
     rate_plots_data = None
     plot_data = None
+    # the confusion matrix covers prediction labels only, but metrics take into account all objects:
+    # target classes that are never predicted too, as sklearn metrics do
+    all_labels = sorted(
+        set(confusion_matrix.labels) | set(target.dropna().unique()) | set(prediction.predictions.dropna().unique())
+    )
+    if all_labels == list(confusion_matrix.labels):
+        all_labels_matrix = np.array(confusion_matrix.values)
+    else:
+        all_labels_matrix = np.array(calculate_matrix(target, prediction.predictions, all_labels).values)
+    matrix_metrics = calculate_confusion_matrix_metrics(all_labels_matrix)
+    accuracy = float(np.trace(all_labels_matrix) / len(target))
     if len(prediction.labels) == 2:
         confusion_by_classes = calculate_confusion_by_classes(
             np.array(confusion_matrix.values),
             confusion_matrix.labels,
         )
         conf_by_pos_label = confusion_by_classes[pos_label]
-        precision = metrics.precision_score(target, prediction.predictions, pos_label=pos_label)
-        recall = metrics.recall_score(target, prediction.predictions, pos_label=pos_label)
-        f1 = metrics.f1_score(target, prediction.predictions, pos_label=pos_label)
+        pos_label_idx = all_labels.index(pos_label)
+        precision = float(matrix_metrics.precision_by_classes[pos_label_idx])
+        recall = float(matrix_metrics.recall_by_classes[pos_label_idx])
+        f1 = float(matrix_metrics.f1_by_classes[pos_label_idx])
         tpr = conf_by_pos_label["tp"] / (conf_by_pos_label["tp"] + conf_by_pos_label["fn"])
         tnr = conf_by_pos_label["tn"] / (conf_by_pos_label["tn"] + conf_by_pos_label["fp"])
         fpr = conf_by_pos_label["fp"] / (conf_by_pos_label["fp"] + conf_by_pos_label["tn"])
         fnr = conf_by_pos_label["fn"] / (conf_by_pos_label["fn"] + conf_by_pos_label["tp"])
     else:
-        precision = metrics.precision_score(target, prediction.predictions, average="macro")
-        recall = metrics.recall_score(target, prediction.predictions, average="macro")
-        f1 = metrics.f1_score(target, prediction.predictions, average="macro")
+        precision = matrix_metrics.precision
+        recall = matrix_metrics.recall
+        f1 = matrix_metrics.f1
     if prediction.prediction_probas is not None:
-        binaraized_target = (
-            target.astype(str).values.reshape(-1, 1) == list(prediction.prediction_probas.columns.astype(str))
-        ).astype(int)
+        binaraized_target = _binarize_target(target, prediction.prediction_probas.columns)
         prediction_probas_array = prediction.prediction_probas.to_numpy()
         roc_auc = metrics.roc_auc_score(binaraized_target, prediction_probas_array, average="macro")
         log_loss = metrics.log_loss(binaraized_target, prediction_probas_array)
@@ -377,7 +453,7 @@ def calculate_metrics(
         rate_plots_data["tnr"] = tnrs
 
     return DatasetClassificationQuality(
-        accuracy=metrics.accuracy_score(target, prediction.predictions),
+        accuracy=accuracy,
         precision=precision,
         recall=recall,
         f1=f1,
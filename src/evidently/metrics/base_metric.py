@@ -6,10 +6,13 @@ from typing import Type
 from typing import TypeVar
 from typing import Union
 
+import dataclasses
 import pandas as pd
 from dataclasses import dataclass
 
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.data_operations import DatasetColumns
+from evidently.utils.data_operations import process_columns
 from evidently.utils.data_preprocessing import DataDefinition
 from evidently.utils.generators import BaseGenerator
 from evidently.utils.generators import make_generator_by_columns
@@ -30,6 +33,16 @@ class InputData:
     current_data: pd.DataFrame
     column_mapping: ColumnMapping
     data_definition: DataDefinition
+    _current_columns: Optional[DatasetColumns] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    def current_columns(self) -> DatasetColumns:
+        """Get columns of the current dataset by the column mapping.
+
+        The columns are processed once and shared by all metrics that are calculated with the data.
+        """
+        if self._current_columns is None:
+            self._current_columns = process_columns(self.current_data, self.column_mapping)
+        return self._current_columns
 
 
 class Metric(Generic[TResult]):
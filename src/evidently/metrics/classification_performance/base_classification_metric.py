@@ -42,8 +42,15 @@ class ThresholdClassificationMetric(Metric[TResult], ABC):
         self,
         data: pd.DataFrame,
         column_mapping: ColumnMapping,
+        dataset_columns: Optional[DatasetColumns] = None,
     ) -> Tuple[pd.Series, PredictionData]:
-        dataset_columns = process_columns(data, column_mapping)
+        """Get target and prediction data from the dataset.
+
+        `dataset_columns` can be passed if columns of the dataset are already processed,
+        e.g. with `InputData.current_columns` for the current data.
+        """
+        if dataset_columns is None:
+            dataset_columns = process_columns(data, column_mapping)
         data = _cleanup_data(data, dataset_columns)
         prediction = get_prediction_data(data, dataset_columns, column_mapping.pos_label)
         if self.threshold is None and self.k is None:
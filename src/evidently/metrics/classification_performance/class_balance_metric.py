@@ -9,7 +9,6 @@ from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import header_text
-from evidently.utils.data_operations import process_columns
 from evidently.utils.visualizations import make_hist_for_cat_plot
 from evidently.utils.visualizations import plot_distr_subplots
 
@@ -21,7 +20,7 @@ class ClassificationClassBalanceResult:
 
 class ClassificationClassBalance(Metric[ClassificationClassBalanceResult]):
     def calculate(self, data: InputData) -> ClassificationClassBalanceResult:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.current_columns()
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
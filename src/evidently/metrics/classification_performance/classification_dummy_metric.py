@@ -1,19 +1,17 @@
+import math
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import dataclasses
 import numpy as np
 import pandas as pd
-from sklearn.metrics import classification_report
-from sklearn.metrics import log_loss
-from sklearn.metrics import precision_score
-from sklearn.metrics import recall_score
 
+from evidently.calculations.classification_performance import ConfusionMatrixMetrics
 from evidently.calculations.classification_performance import DatasetClassificationQuality
-from evidently.calculations.classification_performance import PredictionData
-from evidently.calculations.classification_performance import calculate_matrix
-from evidently.calculations.classification_performance import calculate_metrics
+from evidently.calculations.classification_performance import calculate_confusion_by_classes
+from evidently.calculations.classification_performance import calculate_confusion_matrix_metrics
 from evidently.calculations.classification_performance import k_probability_threshold
 from evidently.metrics.base_metric import InputData
 from evidently.metrics.classification_performance.base_classification_metric import ThresholdClassificationMetric
@@ -22,8 +20,114 @@ from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import header_text
+from evidently.renderers.html_widgets import rounded_table_rows
 from evidently.renderers.html_widgets import table_data
-from evidently.utils.data_operations import process_columns
+
+
+def _labels_ratio(column: pd.Series) -> pd.Series:
+    """Get the ratio of each label in a column, counted with np.bincount over categorical codes"""
+    categorical = pd.Categorical(column)
+    codes = categorical.codes
+    counts = np.bincount(codes[codes >= 0], minlength=len(categorical.categories))
+    return pd.Series(counts / counts.sum(), index=categorical.categories)
+
+
+def _dummy_confusion_matrix(target_ratio: np.ndarray, labels_ratio: pd.Series, sorted_labels: list) -> np.ndarray:
+    """Get the expected confusion matrix of a dummy model that predicts labels at random with the labels ratio.
+
+    Any object with target label i is predicted as label j with probability labels_ratio[j],
+    so the matrix holds expected shares of objects: target_ratio[i] * labels_ratio[j].
+    Sorted labels should cover all labels of the ratio, otherwise the matrix loses a part of the predictions.
+    """
+    preds_ratio = labels_ratio.reindex(sorted_labels, fill_value=0.0).to_numpy()
+    return np.outer(target_ratio, preds_ratio)
+
+
+def _compute_dummy_quality(
+    target_counts: np.ndarray,
+    sorted_labels: list,
+    labels_ratio: pd.Series,
+    pos_label: Union[str, int],
+    is_binary: bool,
+) -> Tuple[DatasetClassificationQuality, ConfusionMatrixMetrics]:
+    """Calculate quality and per-class metrics of a dummy model predicting labels with the labels ratio.
+
+    Metrics are calculated analytically from the expected confusion matrix, no predictions are sampled.
+    `target_counts` are counts of target values for each of sorted labels.
+    Sorted labels should include all target values and all labels of the ratio.
+    """
+    matrix = _dummy_confusion_matrix(target_counts / target_counts.sum(), labels_ratio, sorted_labels)
+    matrix_metrics = calculate_confusion_matrix_metrics(matrix)
+    dummy_precision = matrix_metrics.precision
+    dummy_recall = matrix_metrics.recall
+    dummy_f1 = matrix_metrics.f1
+
+    tpr: Optional[float] = None
+    tnr: Optional[float] = None
+    fpr: Optional[float] = None
+    fnr: Optional[float] = None
+    if is_binary:
+        if pos_label not in sorted_labels:
+            raise ValueError(f"Cannot find pos_label '{pos_label}' in labels {sorted_labels}")
+        pos_label_idx = sorted_labels.index(pos_label)
+        dummy_precision = float(matrix_metrics.precision_by_classes[pos_label_idx])
+        dummy_recall = float(matrix_metrics.recall_by_classes[pos_label_idx])
+        dummy_f1 = float(matrix_metrics.f1_by_classes[pos_label_idx])
+        conf_by_pos_label = calculate_confusion_by_classes(matrix, sorted_labels)[pos_label]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tpr = float(conf_by_pos_label["tp"] / (conf_by_pos_label["tp"] + conf_by_pos_label["fn"]))
+            tnr = float(conf_by_pos_label["tn"] / (conf_by_pos_label["tn"] + conf_by_pos_label["fp"]))
+            fpr = float(conf_by_pos_label["fp"] / (conf_by_pos_label["fp"] + conf_by_pos_label["tn"]))
+            fnr = float(conf_by_pos_label["fn"] / (conf_by_pos_label["fn"] + conf_by_pos_label["tp"]))
+
+    dummy_quality = DatasetClassificationQuality(
+        accuracy=matrix_metrics.accuracy,
+        precision=dummy_precision,
+        recall=dummy_recall,
+        f1=dummy_f1,
+        tpr=tpr,
+        tnr=tnr,
+        fpr=fpr,
+        fnr=fnr,
+    )
+    return dummy_quality, matrix_metrics
+
+
+def _metrics_matrix_by_classes(
+    sorted_labels: list,
+    matrix_metrics: ConfusionMatrixMetrics,
+    target_counts: np.ndarray,
+) -> dict:
+    """Get metrics by classes in the shape of sklearn classification_report with output_dict=True.
+
+    Only classes that present in target or in predictions are reported, averages are taken over them.
+    """
+    present = matrix_metrics.present_classes
+    support = target_counts[present]
+    total_support = int(support.sum())
+    metrics_matrix: dict = {
+        str(sorted_labels[idx]): {
+            "precision": float(matrix_metrics.precision_by_classes[idx]),
+            "recall": float(matrix_metrics.recall_by_classes[idx]),
+            "f1-score": float(matrix_metrics.f1_by_classes[idx]),
+            "support": int(target_counts[idx]),
+        }
+        for idx in np.flatnonzero(present)
+    }
+    metrics_matrix["accuracy"] = matrix_metrics.accuracy
+    metrics_matrix["macro avg"] = {
+        "precision": matrix_metrics.precision,
+        "recall": matrix_metrics.recall,
+        "f1-score": matrix_metrics.f1,
+        "support": total_support,
+    }
+    metrics_matrix["weighted avg"] = {
+        "precision": float(np.average(matrix_metrics.precision_by_classes[present], weights=support)),
+        "recall": float(np.average(matrix_metrics.recall_by_classes[present], weights=support)),
+        "f1-score": float(np.average(matrix_metrics.f1_by_classes[present], weights=support)),
+        "support": total_support,
+    }
+    return metrics_matrix
 
 
 @dataclasses.dataclass
@@ -43,13 +147,11 @@ class ClassificationDummyMetric(ThresholdClassificationMetric[ClassificationDumm
         k: Optional[Union[float, int]] = None,
     ):
         super().__init__(threshold, k)
-        self.threshold = threshold
-        self.k = k
         self.quality_metric = ClassificationQualityMetric()
 
     def calculate(self, data: InputData) -> ClassificationDummyMetricResults:
         quality_metric: Optional[ClassificationQualityMetric]
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.current_columns()
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
 
@@ -60,115 +162,100 @@ class ClassificationDummyMetric(ThresholdClassificationMetric[ClassificationDumm
         else:
             quality_metric = self.quality_metric
 
-        #  dummy by current
-        labels_ratio = data.current_data[target_name].value_counts(normalize=True)
-        np.random.seed(0)
-        dummy_preds = np.random.choice(labels_ratio.index, data.current_data.shape[0], p=labels_ratio)
-        dummy_preds = pd.Series(dummy_preds)
-        prediction: Optional[PredictionData] = None
+        # target and prediction are extracted once and shared by the current and reference dummies
+        prediction_probas: Optional[pd.DataFrame] = None
         if prediction_name is not None:
-            target, prediction = self.get_target_prediction_data(data.current_data, data.column_mapping)
+            target, prediction = self.get_target_prediction_data(
+                data.current_data, data.column_mapping, dataset_columns
+            )
             labels = prediction.labels
+            prediction_probas = prediction.prediction_probas
         else:
             target = data.current_data[target_name]
             labels = list(target.unique())
+        # dummies predict target values of the current or the reference data,
+        # so the labels cover them too and neither target nor predictions are left out of the matrix
+        dummy_labels = set(labels) | set(data.current_data[target_name].dropna().unique())
+        if data.reference_data is not None:
+            dummy_labels |= set(data.reference_data[target_name].dropna().unique())
+        sorted_labels = sorted(dummy_labels)
+        is_binary = len(labels) == 2
+        # target is counted by labels once for the current and reference dummies
+        target_positions = pd.Categorical(target, categories=sorted_labels).codes
+        target_counts = np.bincount(target_positions[target_positions >= 0], minlength=len(sorted_labels))
+        pos_label = data.column_mapping.pos_label if data.column_mapping.pos_label is not None else 1
 
-        current_matrix = calculate_matrix(
-            target,
-            dummy_preds,
-            labels,
-        )
-        current_dummy = calculate_metrics(
-            data.column_mapping,
-            current_matrix,
-            target,
-            PredictionData(predictions=dummy_preds, prediction_probas=None, labels=labels),
-        )
-
-        metrics_matrix = classification_report(
-            target,
-            dummy_preds,
-            output_dict=True,
+        #  dummy by current
+        current_dummy, current_matrix_metrics = _compute_dummy_quality(
+            target_counts,
+            sorted_labels,
+            _labels_ratio(data.current_data[target_name]),
+            pos_label,
+            is_binary,
         )
-
-        if prediction is not None and prediction.prediction_probas is not None and len(labels) == 2:
-            if self.threshold is not None or self.k is not None:
-                if self.threshold is not None:
-                    threshold = self.threshold
-                if self.k is not None:
-                    threshold = k_probability_threshold(prediction.prediction_probas, self.k)
-            else:
-                threshold = 0.5
-            current_dummy = self.correction_for_threshold(
-                current_dummy, threshold, target, labels, prediction.prediction_probas.shape
-            )
-            # metrix matrix
-            # neg label data
-            if threshold == 1.0:
-                coeff_recall = 1.0
-            else:
-                coeff_recall = min(1.0, 0.5 / (1 - threshold))
-            coeff_precision = min(1.0, (1 - threshold) / 0.5)
-            neg_label_precision = precision_score(target, dummy_preds, pos_label=labels[1]) * coeff_precision
-            neg_label_recall = recall_score(target, dummy_preds, pos_label=labels[1]) * coeff_recall
-            metrics_matrix = {
-                str(labels[0]): {
-                    "precision": current_dummy.precision,
-                    "recall": current_dummy.recall,
-                    "f1-score": current_dummy.f1,
-                },
-                str(labels[1]): {
-                    "precision": neg_label_precision,
-                    "recall": neg_label_recall,
-                    "f1-score": 2 * neg_label_precision * neg_label_recall / (neg_label_precision + neg_label_recall),
-                },
-            }
-        if prediction is not None and prediction.prediction_probas is not None:
-            # dummy log_loss and roc_auc
-            binaraized_target = (target.astype(str).values.reshape(-1, 1) == list(labels)).astype(int)
-            dummy_prediction = np.full(prediction.prediction_probas.shape, 1 / prediction.prediction_probas.shape[1])
-            current_dummy.log_loss = log_loss(binaraized_target, dummy_prediction)
-            current_dummy.roc_auc = 0.5
+        metrics_matrix = _metrics_matrix_by_classes(sorted_labels, current_matrix_metrics, target_counts)
 
         # dummy by reference
         by_reference_dummy: Optional[DatasetClassificationQuality] = None
         if data.reference_data is not None:
-            labels_ratio = data.reference_data[target_name].value_counts(normalize=True)
-            np.random.seed(1)
-            dummy_preds = np.random.choice(labels_ratio.index, data.current_data.shape[0], p=labels_ratio)
-            dummy_preds = pd.Series(dummy_preds)
-
-            if prediction_name is not None:
-                target, prediction = self.get_target_prediction_data(data.current_data, data.column_mapping)
-                labels = prediction.labels
-            else:
-                target = data.current_data[target_name]
-                labels = list(target.unique())
-
-            current_matrix = calculate_matrix(
-                target,
-                dummy_preds,
-                labels,
-            )
-            by_reference_dummy = calculate_metrics(
-                data.column_mapping,
-                current_matrix,
-                target,
-                PredictionData(predictions=dummy_preds, prediction_probas=None, labels=labels),
+            by_reference_dummy, _ = _compute_dummy_quality(
+                target_counts,
+                sorted_labels,
+                _labels_ratio(data.reference_data[target_name]),
+                pos_label,
+                is_binary,
             )
-            if prediction is not None and prediction.prediction_probas is not None and len(labels) == 2:
-                by_reference_dummy = self.correction_for_threshold(
-                    by_reference_dummy, threshold, target, labels, prediction.prediction_probas.shape
-                )
-            if prediction is not None and prediction.prediction_probas is not None:
-                # dummy log_loss and roc_auc
-                binaraized_target = (target.astype(str).values.reshape(-1, 1) == list(labels)).astype(int)
-                dummy_prediction = np.full(
-                    prediction.prediction_probas.shape, 1 / prediction.prediction_probas.shape[1]
-                )
+
+        if prediction_probas is not None:
+            probas_shape = prediction_probas.shape
+            if is_binary:
+                if self.k is not None:
+                    threshold = k_probability_threshold(prediction_probas, self.k)
+                elif self.threshold is not None:
+                    threshold = self.threshold
+                else:
+                    threshold = 0.5
+                current_dummy = self.correction_for_threshold(current_dummy, threshold, target, labels, probas_shape)
                 if by_reference_dummy is not None:
-                    by_reference_dummy.log_loss = log_loss(binaraized_target, dummy_prediction)
-                    by_reference_dummy.roc_auc = 0.5
+                    by_reference_dummy = self.correction_for_threshold(
+                        by_reference_dummy, threshold, target, labels, probas_shape
+                    )
+                # metrix matrix
+                # neg label data
+                if threshold == 1.0:
+                    coeff_recall = 1.0
+                else:
+                    coeff_recall = min(1.0, 0.5 / (1 - threshold))
+                coeff_precision = min(1.0, (1 - threshold) / 0.5)
+                neg_label_idx = sorted_labels.index(labels[1])
+                neg_label_precision = (
+                    float(current_matrix_metrics.precision_by_classes[neg_label_idx]) * coeff_precision
+                )
+                neg_label_recall = float(current_matrix_metrics.recall_by_classes[neg_label_idx]) * coeff_recall
+                if neg_label_precision + neg_label_recall > 0:
+                    neg_label_f1 = 2 * neg_label_precision * neg_label_recall / (neg_label_precision + neg_label_recall)
+                else:
+                    neg_label_f1 = 0.0
+                metrics_matrix = {
+                    str(labels[0]): {
+                        "precision": current_dummy.precision,
+                        "recall": current_dummy.recall,
+                        "f1-score": current_dummy.f1,
+                    },
+                    str(labels[1]): {
+                        "precision": neg_label_precision,
+                        "recall": neg_label_recall,
+                        "f1-score": neg_label_f1,
+                    },
+                }
+            # dummy log_loss and roc_auc do not depend on dummy predictions and are the same for both dummies
+            # log_loss of the uniform probability 1 / K for every class is log(K)
+            dummy_log_loss = math.log(probas_shape[1])
+            current_dummy.log_loss = dummy_log_loss
+            current_dummy.roc_auc = 0.5
+            if by_reference_dummy is not None:
+                by_reference_dummy.log_loss = dummy_log_loss
+                by_reference_dummy.roc_auc = 0.5
 
         # model quality
         model_quality: Optional[DatasetClassificationQuality] = None
@@ -211,16 +298,15 @@ class ClassificationDummyMetric(ThresholdClassificationMetric[ClassificationDumm
             fpr = dummy_results.fpr * coeff_recall
             fnr = dummy_results.fnr * coeff_precision
 
+        precision = dummy_results.precision * coeff_precision
+        recall = dummy_results.recall * coeff_recall
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+
         return DatasetClassificationQuality(
             accuracy=dummy_results.accuracy,
-            precision=dummy_results.precision * coeff_precision,
-            recall=dummy_results.recall * coeff_recall,
-            f1=2
-            * dummy_results.precision
-            * coeff_precision
-            * dummy_results.recall
-            * coeff_recall
-            / (dummy_results.precision * coeff_precision + dummy_results.recall * coeff_recall),
+            precision=precision,
+            recall=recall,
+            f1=f1,
             roc_auc=0.5,
             log_loss=None,
             tpr=tpr,
@@ -230,6 +316,10 @@ class ClassificationDummyMetric(ThresholdClassificationMetric[ClassificationDumm
         )
 
 
+def _quality_values(quality: DatasetClassificationQuality) -> np.ndarray:
+    return np.array([quality.accuracy, quality.precision, quality.recall, quality.f1], dtype=np.float64)
+
+
 @default_renderer(wrap_type=ClassificationDummyMetric)
 class ClassificationDummyMetricRenderer(MetricRenderer):
     def render_json(self, obj: ClassificationDummyMetric) -> dict:
@@ -238,38 +328,24 @@ class ClassificationDummyMetricRenderer(MetricRenderer):
 
     def render_html(self, obj: ClassificationDummyMetric) -> List[BaseWidgetInfo]:
         metric_result = obj.get_result()
-        in_table_data = pd.DataFrame(data=["accuracy", "precision", "recall", "f1"])
         columns = ["Metric"]
+        quality_values = []
         if metric_result.by_reference_dummy is not None:
-            in_table_data["by_ref"] = [
-                metric_result.by_reference_dummy.accuracy,
-                metric_result.by_reference_dummy.precision,
-                metric_result.by_reference_dummy.recall,
-                metric_result.by_reference_dummy.f1,
-            ]
+            quality_values.append(_quality_values(metric_result.by_reference_dummy))
             columns.append("Dummy (by rerefence)")
 
-        in_table_data["by_curr"] = [
-            metric_result.dummy.accuracy,
-            metric_result.dummy.precision,
-            metric_result.dummy.recall,
-            metric_result.dummy.f1,
-        ]
+        quality_values.append(_quality_values(metric_result.dummy))
         if "Dummy (by rerefence)" in columns:
             columns.append("Dummy (by current)")
         else:
             columns.append("Dummy")
 
         if metric_result.model_quality is not None:
-            in_table_data["model_quality"] = [
-                metric_result.model_quality.accuracy,
-                metric_result.model_quality.precision,
-                metric_result.model_quality.recall,
-                metric_result.model_quality.f1,
-            ]
+            quality_values.append(_quality_values(metric_result.model_quality))
             columns.append("Model")
 
+        in_table_data = rounded_table_rows(["accuracy", "precision", "recall", "f1"], quality_values)
         return [
             header_text(label="Dummy Classification Quality"),
-            table_data(column_names=columns, data=np.around(in_table_data, 3).values, title=""),
+            table_data(column_names=columns, data=in_table_data, title=""),
         ]
@@ -15,7 +15,6 @@ from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import CounterData
 from evidently.renderers.html_widgets import counter
 from evidently.renderers.html_widgets import header_text
-from evidently.utils.data_operations import process_columns
 
 
 @dataclasses.dataclass
@@ -39,12 +38,12 @@ class ClassificationQualityMetric(ThresholdClassificationMetric[ClassificationQu
         self.confusion_matrix_metric = ClassificationConfusionMatrix(threshold, k)
 
     def calculate(self, data: InputData) -> ClassificationQualityMetricResult:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.current_columns()
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
-        target, prediction = self.get_target_prediction_data(data.current_data, data.column_mapping)
+        target, prediction = self.get_target_prediction_data(data.current_data, data.column_mapping, dataset_columns)
         current = calculate_metrics(
             data.column_mapping,
             self.confusion_matrix_metric.get_result().current_matrix,
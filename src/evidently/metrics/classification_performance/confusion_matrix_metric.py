@@ -4,7 +4,6 @@ from typing import Union
 
 import dataclasses
 import pandas as pd
-from sklearn.metrics import confusion_matrix
 
 from evidently.calculations.classification_performance import ConfusionMatrix
 from evidently.calculations.classification_performance import calculate_matrix
@@ -35,7 +34,9 @@ class ClassificationConfusionMatrix(ThresholdClassificationMetric[Classification
         super().__init__(threshold, k)
 
     def calculate(self, data: InputData) -> ClassificationConfusionMatrixResult:
-        current_target_data, current_pred = self.get_target_prediction_data(data.current_data, data.column_mapping)
+        current_target_data, current_pred = self.get_target_prediction_data(
+            data.current_data, data.column_mapping, data.current_columns()
+        )
 
         current_results = calculate_matrix(
             current_target_data,
@@ -16,7 +16,6 @@ from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import GraphData
 from evidently.renderers.html_widgets import WidgetSize
 from evidently.renderers.html_widgets import plotly_graph_tabs
-from evidently.utils.data_operations import process_columns
 
 
 @dataclasses.dataclass
@@ -40,7 +39,7 @@ class ClassificationProbDistribution(Metric[ClassificationProbDistributionResult
         return result
 
     def calculate(self, data: InputData) -> ClassificationProbDistributionResults:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.current_columns()
         prediction = columns.utility_columns.prediction
         target = columns.utility_columns.target
 
@@ -19,7 +19,6 @@ from evidently.renderers.html_widgets import WidgetSize
 from evidently.renderers.html_widgets import header_text
 from evidently.renderers.html_widgets import plotly_figure
 from evidently.utils.data_operations import DatasetColumns
-from evidently.utils.data_operations import process_columns
 
 
 @dataclasses.dataclass
@@ -40,10 +39,11 @@ class ClassificationQualityByClass(ThresholdClassificationMetric[ClassificationQ
         super().__init__(threshold, k)
 
     def calculate(self, data: InputData) -> ClassificationQualityByClassResult:
-        columns = process_columns(data.current_data, data.column_mapping)
+        columns = data.current_columns()
         target, prediction = self.get_target_prediction_data(
             data.current_data,
             column_mapping=data.column_mapping,
+            dataset_columns=columns,
         )
         metrics_matrix = sklearn.metrics.classification_report(
             target,
@@ -18,7 +18,6 @@ from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import header_text
-from evidently.utils.data_operations import process_columns
 
 
 @dataclasses.dataclass
@@ -38,7 +37,7 @@ class ClassificationQualityByFeatureTable(Metric[ClassificationQualityByFeatureT
         self.columns = columns
 
     def calculate(self, data: InputData) -> ClassificationQualityByFeatureTableResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.current_columns()
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         curr_df = data.current_data.copy()
@@ -16,7 +16,6 @@ from evidently.renderers.html_widgets import TabData
 from evidently.renderers.html_widgets import get_roc_auc_tab_data
 from evidently.renderers.html_widgets import header_text
 from evidently.renderers.html_widgets import widget_tabs
-from evidently.utils.data_operations import process_columns
 
 
 @dataclasses.dataclass
@@ -27,7 +26,7 @@ class ClassificationRocCurveResults:
 
 class ClassificationRocCurve(Metric[ClassificationRocCurveResults]):
     def calculate(self, data: InputData) -> ClassificationRocCurveResults:
-        dataset_columns = process_columns(data.current_data, data.column_mapping)
+        dataset_columns = data.current_columns()
         target_name = dataset_columns.utility_columns.target
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
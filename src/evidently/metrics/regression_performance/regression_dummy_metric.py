@@ -3,7 +3,6 @@ from typing import Optional
 
 import dataclasses
 import numpy as np
-import pandas as pd
 from sklearn.metrics import mean_absolute_error
 from sklearn.metrics import mean_absolute_percentage_error
 from sklearn.metrics import mean_squared_error
@@ -15,6 +14,7 @@ from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import header_text
+from evidently.renderers.html_widgets import rounded_table_rows
 from evidently.renderers.html_widgets import table_data
 from evidently.utils.data_operations import process_columns
 
@@ -156,27 +156,31 @@ class RegressionDummyMetricRenderer(MetricRenderer):
 
     def render_html(self, obj: RegressionDummyMetric) -> List[BaseWidgetInfo]:
         metric_result = obj.get_result()
-        in_table_data = pd.DataFrame(data=["MAE", "RMSE", "MAPE", "MAX_ERROR"])
         columns = ["Metric"]
+        quality_values = []
         if (
             metric_result.abs_error_max_by_ref is not None
             and metric_result.mean_abs_perc_error_by_ref is not None
             and metric_result.rmse_by_ref is not None
             and metric_result.mean_abs_error_by_ref is not None
         ):
-            in_table_data["by_ref"] = [
-                metric_result.mean_abs_error_by_ref,
-                metric_result.rmse_by_ref,
-                metric_result.mean_abs_perc_error_by_ref,
-                metric_result.abs_error_max_by_ref,
-            ]
+            quality_values.append(
+                [
+                    metric_result.mean_abs_error_by_ref,
+                    metric_result.rmse_by_ref,
+                    metric_result.mean_abs_perc_error_by_ref,
+                    metric_result.abs_error_max_by_ref,
+                ]
+            )
             columns.append("Dummy (by rerefence)")
-        in_table_data["by_carr"] = [
-            metric_result.mean_abs_error_default,
-            metric_result.rmse_default,
-            metric_result.mean_abs_perc_error_default,
-            metric_result.abs_error_max_default,
-        ]
+        quality_values.append(
+            [
+                metric_result.mean_abs_error_default,
+                metric_result.rmse_default,
+                metric_result.mean_abs_perc_error_default,
+                metric_result.abs_error_max_default,
+            ]
+        )
         if "Dummy (by rerefence)" in columns:
             columns.append("Dummy (by current)")
         else:
@@ -187,15 +191,18 @@ class RegressionDummyMetricRenderer(MetricRenderer):
             and metric_result.mean_abs_perc_error is not None
             and metric_result.abs_error_max is not None
         ):
-            in_table_data["model_quality"] = [
-                metric_result.mean_abs_error,
-                metric_result.rmse,
-                metric_result.mean_abs_perc_error,
-                metric_result.abs_error_max,
-            ]
+            quality_values.append(
+                [
+                    metric_result.mean_abs_error,
+                    metric_result.rmse,
+                    metric_result.mean_abs_perc_error,
+                    metric_result.abs_error_max,
+                ]
+            )
             columns.append("Model")
 
+        in_table_data = rounded_table_rows(["MAE", "RMSE", "MAPE", "MAX_ERROR"], quality_values)
         return [
             header_text(label="Dummy Regreesion Quality"),
-            table_data(column_names=columns, data=np.around(in_table_data, 3).values, title=""),
+            table_data(column_names=columns, data=in_table_data, title=""),
         ]
@@ -270,6 +270,26 @@ def table_data(
     )
 
 
+def rounded_table_rows(
+    row_names: Iterable[str], values_columns: Iterable[Iterable[Numeric]], decimals: int = 3
+) -> np.ndarray:
+    """
+    generate table rows with a row name and rounded numeric values, one value from each of values columns
+
+    Args:
+        row_names: names of rows to show in the first column
+        values_columns: list of numeric columns, each with a value for every row
+        decimals: number of decimals to round the values to
+
+    Example:
+        >>> rows = rounded_table_rows(["MAE", "RMSE"], [[0.12345, 1.0], [0.5, 2.34567]])
+        >>> widget_info = table_data(column_names=["Metric", "Dummy", "Model"], data=rows)
+    """
+    # values are rounded as one float block, row names are added to the rounded values after that
+    values = np.round(np.column_stack([np.asarray(column, dtype=np.float64) for column in values_columns]), decimals)
+    return np.concatenate([np.array(list(row_names), dtype=object).reshape(-1, 1), values.astype(object)], axis=1)
+
+
 class ColumnType(Enum):
     STRING = "string"
     LINE = "line"
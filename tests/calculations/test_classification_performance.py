@@ -1,6 +1,14 @@
 import numpy as np
+import pandas as pd
 
+from evidently import ColumnMapping
+from evidently.calculations.classification_performance import PredictionData
+from evidently.calculations.classification_performance import _binarize_target
 from evidently.calculations.classification_performance import calculate_confusion_by_classes
+from evidently.calculations.classification_performance import calculate_confusion_matrix_metrics
+from evidently.calculations.classification_performance import calculate_matrix
+from evidently.calculations.classification_performance import calculate_matrix_encoded
+from evidently.calculations.classification_performance import calculate_metrics
 
 
 def test_calculate_confusion_by_classes():
@@ -9,3 +17,52 @@ def test_calculate_confusion_by_classes():
     confusion_by_classes = calculate_confusion_by_classes(confusion_matrix, labels)
     assert confusion_by_classes[labels[0]] == {"tp": 4, "fn": 1, "fp": 2, "tn": 5}
     assert confusion_by_classes[labels[1]] == {"tp": 5, "fn": 2, "fp": 1, "tn": 4}
+
+
+def test_calculate_confusion_matrix_metrics():
+    # the last class is neither in target nor in predictions and is not taken into account in macro averages
+    confusion_matrix = np.array([[4, 1, 0, 0], [2, 5, 0, 0], [1, 1, 0, 0], [0, 0, 0, 0]])
+    matrix_metrics = calculate_confusion_matrix_metrics(confusion_matrix)
+    assert np.isclose(matrix_metrics.accuracy, 9 / 14)
+    np.testing.assert_allclose(matrix_metrics.precision_by_classes, [4 / 7, 5 / 7, 0, 0])
+    np.testing.assert_allclose(matrix_metrics.recall_by_classes, [4 / 5, 5 / 7, 0, 0])
+    np.testing.assert_allclose(matrix_metrics.f1_by_classes, [2 / 3, 5 / 7, 0, 0])
+    np.testing.assert_array_equal(matrix_metrics.present_classes, [True, True, True, False])
+    assert np.isclose(matrix_metrics.precision, 3 / 7)
+    assert np.isclose(matrix_metrics.recall, (4 / 5 + 5 / 7) / 3)
+    assert np.isclose(matrix_metrics.f1, (2 / 3 + 5 / 7) / 3)
+
+
+def test_binarize_target():
+    target = pd.Series([1, 0, 2, 1])
+    binaraized_target = _binarize_target(target, ["1", "0", "3"])
+    np.testing.assert_array_equal(binaraized_target, [[1, 0, 0], [0, 1, 0], [0, 0, 0], [1, 0, 0]])
+
+
+def test_calculate_matrix_encoded():
+    matrix = calculate_matrix_encoded(np.array([0, 0, 1, 2, -1]), np.array([0, 1, 1, -1, 0]), 3)
+    np.testing.assert_array_equal(matrix, [[1, 1, 0], [0, 1, 0], [0, 0, 0]])
+
+
+def test_calculate_matrix():
+    target = pd.Series(["b", "a", "c", "a", "b"])
+    prediction = pd.Series(["b", "b", "a", "a", "c"])
+    confusion_matrix = calculate_matrix(target, prediction, ["c", "a", "b"])
+    assert confusion_matrix.labels == ["a", "b", "c"]
+    assert confusion_matrix.values == [[1, 1, 0], [0, 1, 1], [1, 0, 0]]
+
+
+def test_calculate_metrics_target_class_not_in_predictions():
+    target = pd.Series(["a", "b", "c", "d", "d", "d", "a", "b"])
+    predictions = pd.Series(["a", "b", "c", "a", "b", "c", "a", "b"])
+    labels = predictions.unique().tolist()
+    confusion_matrix = calculate_matrix(target, predictions, labels)
+    quality = calculate_metrics(
+        ColumnMapping(),
+        confusion_matrix,
+        target,
+        PredictionData(predictions=predictions, prediction_probas=None, labels=labels),
+    )
+    assert np.isclose(quality.accuracy, 5 / 8)
+    assert np.isclose(quality.precision, (2 / 3 + 2 / 3 + 1 / 2 + 0) / 4)
+    assert np.isclose(quality.recall, 3 / 4)
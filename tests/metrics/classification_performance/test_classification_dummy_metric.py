@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+
+from evidently import ColumnMapping
+from evidently.metrics import ClassificationDummyMetric
+from evidently.report import Report
+
+
+def test_classification_dummy_metrics_matrix():
+    current = pd.DataFrame(
+        data=dict(
+            target=["a", "a", "a", "b", "b", "b", "c", "c", "c"],
+            prediction=["a", "b", "c", "a", "b", "c", "a", "b", "c"],
+        ),
+    )
+
+    metric = ClassificationDummyMetric()
+    report = Report(metrics=[metric])
+    report.run(reference_data=None, current_data=current, column_mapping=ColumnMapping())
+
+    metrics_matrix = metric.get_result().metrics_matrix
+    assert list(metrics_matrix.keys()) == ["a", "b", "c", "accuracy", "macro avg", "weighted avg"]
+    assert sum(metrics_matrix[label]["support"] for label in ("a", "b", "c")) == 9
+    assert np.isclose(metrics_matrix["accuracy"], 1 / 3)
+    assert np.isclose(metrics_matrix["macro avg"]["precision"], 1 / 3)
+    assert metrics_matrix["macro avg"]["support"] == 9
+    assert np.isclose(metrics_matrix["weighted avg"]["recall"], 1 / 3)
+    assert metrics_matrix["weighted avg"]["support"] == 9
+
+    for label in ("a", "b", "c"):
+        class_metrics = metrics_matrix[label]
+        precision = class_metrics["precision"]
+        recall = class_metrics["recall"]
+        expected_f1 = 0.0 if precision + recall == 0 else 2 * precision * recall / (precision + recall)
+        assert np.isclose(class_metrics["f1-score"], expected_f1)
+
+
+def test_classification_dummy_log_loss():
+    current = pd.DataFrame(
+        data=dict(
+            target=[1, 1, 1, 1, 0, 0, 0, 0, 1],
+            prediction=[0.7, 0.8, 0.9, 0.4, 0.1, 0.2, 0.1, 0.3, 0.8],
+        ),
+    )
+    reference = pd.DataFrame(
+        data=dict(
+            target=[1, 0, 0, 0, 0, 1],
+            prediction=[0.6, 0.1, 0.2, 0.4, 0.3, 0.9],
+        ),
+    )
+
+    metric = ClassificationDummyMetric()
+    report = Report(metrics=[metric])
+    report.run(reference_data=reference, current_data=current, column_mapping=ColumnMapping())
+
+    results = metric.get_result()
+    assert np.isclose(results.dummy.log_loss, np.log(2))
+    assert np.isclose(results.dummy.roc_auc, 0.5)
+    assert results.by_reference_dummy is not None
+    assert np.isclose(results.by_reference_dummy.log_loss, np.log(2))
+    assert np.isclose(results.by_reference_dummy.roc_auc, 0.5)
+
+
+def test_classification_dummy_quality():
+    current = pd.DataFrame(
+        data=dict(
+            target=["a", "a", "a", "b", "b", "b", "c", "c", "c"],
+            prediction=["a", "b", "c", "a", "b", "c", "a", "b", "c"],
+        ),
+    )
+    reference = pd.DataFrame(
+        data=dict(
+            target=["a", "a", "b", "b"],
+            prediction=["a", "b", "c", "b"],
+        ),
+    )
+
+    metric = ClassificationDummyMetric()
+    report = Report(metrics=[metric])
+    report.run(reference_data=reference, current_data=current, column_mapping=ColumnMapping())
+
+    results = metric.get_result()
+    assert np.isclose(results.dummy.accuracy, 1 / 3)
+    assert np.isclose(results.dummy.precision, 1 / 3)
+    assert np.isclose(results.dummy.recall, 1 / 3)
+    assert np.isclose(results.dummy.f1, 1 / 3)
+    assert results.by_reference_dummy is not None
+    assert np.isclose(results.by_reference_dummy.accuracy, 1 / 3)
+    assert np.isclose(results.by_reference_dummy.precision, 2 / 9)
+    assert np.isclose(results.by_reference_dummy.recall, 1 / 3)
+
+
+def test_classification_dummy_quality_reference_class_not_in_current():
+    current = pd.DataFrame(
+        data=dict(
+            target=["a", "a", "a", "a", "a", "b", "b", "b", "c", "c"],
+            prediction=["a", "b", "c", "a", "b", "c", "a", "b", "c", "a"],
+        ),
+    )
+    reference = pd.DataFrame(
+        data=dict(
+            target=["a", "b", "d", "d"],
+            prediction=["a", "b", "c", "a"],
+        ),
+    )
+
+    metric = ClassificationDummyMetric()
+    report = Report(metrics=[metric])
+    report.run(reference_data=reference, current_data=current, column_mapping=ColumnMapping())
+
+    # the reference dummy predicts "d" for a half of objects, and all of them are wrong
+    results = metric.get_result()
+    assert results.by_reference_dummy is not None
+    assert np.isclose(results.by_reference_dummy.accuracy, 0.5 * 0.25 + 0.3 * 0.25)
+    assert np.isclose(results.by_reference_dummy.precision, (0.5 + 0.3) / 4)
+    assert np.isclose(results.by_reference_dummy.recall, (0.25 + 0.25) / 4)
+    assert "d" not in results.metrics_matrix
+
+
+def test_classification_dummy_quality_binary():
+    current = pd.DataFrame(
+        data=dict(
+            target=[1, 1, 1, 0],
+            prediction=[1, 0, 1, 1],
+        ),
+    )
+
+    metric = ClassificationDummyMetric()
+    report = Report(metrics=[metric])
+    report.run(reference_data=None, current_data=current, column_mapping=ColumnMapping())
+
+    results = metric.get_result()
+    assert np.isclose(results.dummy.accuracy, 0.625)
+    assert np.isclose(results.dummy.precision, 0.75)
+    assert np.isclose(results.dummy.recall, 0.75)
+    assert np.isclose(results.dummy.f1, 0.75)
+    assert np.isclose(results.dummy.tpr, 0.75)
+    assert np.isclose(results.dummy.tnr, 0.25)
+    assert np.isclose(results.dummy.fpr, 0.75)
+    assert np.isclose(results.dummy.fnr, 0.25)
+    assert results.by_reference_dummy is None
+
+
+def test_classification_dummy_uses_current_columns(monkeypatch):
+    from evidently.metrics.classification_performance import base_classification_metric
+
+    def process_columns(*args, **kwargs):
+        raise AssertionError("current columns should be taken from InputData")
+
+    monkeypatch.setattr(base_classification_metric, "process_columns", process_columns)
+    current = pd.DataFrame(
+        data=dict(
+            target=["a", "a", "b", "b"],
+            prediction=["a", "b", "b", "b"],
+        ),
+    )
+
+    metric = ClassificationDummyMetric()
+    report = Report(metrics=[metric])
+    report.run(reference_data=None, current_data=current, column_mapping=ColumnMapping(pos_label="a"))
+
+    assert np.isclose(metric.get_result().model_quality.accuracy, 0.75)
+    assert np.isclose(metric.get_result().dummy.accuracy, 0.5)
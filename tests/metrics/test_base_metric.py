@@ -1,8 +1,11 @@
 import pandas as pd
 
+from evidently import ColumnMapping
 from evidently.metrics import ColumnValueRangeMetric
+from evidently.metrics.base_metric import InputData
 from evidently.metrics.base_metric import generate_column_metrics
 from evidently.report import Report
+from evidently.utils.data_preprocessing import create_data_definition
 
 
 def test_metric_generator():
@@ -20,3 +23,15 @@ def test_metric_generator():
     )
     report.run(current_data=test_data, reference_data=None)
     assert report.show()
+
+
+def test_input_data_current_columns():
+    test_data = pd.DataFrame({"target": [1, 0, 1], "prediction": [1, 1, 0], "col1": [4, 5, 6]})
+    column_mapping = ColumnMapping()
+    data = InputData(None, test_data, column_mapping, create_data_definition(None, test_data, column_mapping))
+
+    columns = data.current_columns()
+    assert columns.utility_columns.target == "target"
+    assert columns.utility_columns.prediction == "prediction"
+    assert columns.num_feature_names == ["col1"]
+    assert data.current_columns() is columns